@@ -1,6 +1,9 @@
 """Table components."""
-from typing import List, Tuple
+import os
+from functools import lru_cache
+from typing import Dict, List, Tuple, Type
 
+from reflex import constants
 from reflex.components.component import Component
 from reflex.components.layout.foreach import Foreach
 from reflex.components.libs.chakra import ChakraComponent
@@ -8,6 +11,103 @@ from reflex.utils import types
 from reflex.vars import Var
 
 
+def _should_validate() -> bool:
+    """Check whether table type checks are enabled.
+
+    Returns:
+        False if the skip typecheck env var is set to "1", True otherwise.
+    """
+    return os.environ.get(constants.SKIP_TYPECHECK_ENV_VAR) != "1"
+
+
+# Whether to type check the headers, rows and footers passed to tables.
+_VALIDATE = _should_validate()
+
+
+def _call_cached(func, type_):
+    """Call an lru_cache'd function, bypassing the cache for unhashable types.
+
+    Args:
+        func: The cached function.
+        type_: The type to pass to the function.
+
+    Returns:
+        The result of the function.
+    """
+    try:
+        hash(type_)
+    except TypeError:
+        # Some annotations (e.g. Annotated with list metadata) cannot be hashed.
+        return func.__wrapped__(type_)
+    return func(type_)
+
+
+# Resolving the base class of the same row/header annotations is repeated for
+# every table created, so memoize it.
+_cached_get_base_class = lru_cache(maxsize=512)(types.get_base_class)
+
+
+def _get_base_class(type_):
+    """Get the base class of a type, memoized when the type is hashable.
+
+    Args:
+        type_: The type.
+
+    Returns:
+        The base class of the type.
+    """
+    return _call_cached(_cached_get_base_class, type_)
+
+
+def _is_list_or_tuple(value) -> bool:
+    """Check whether a value (or the type of a var) is a list or tuple.
+
+    Args:
+        value: The value or var to check.
+
+    Returns:
+        Whether the base type of the value is a list or tuple.
+    """
+    type_ = value.type_ if isinstance(value, Var) else type(value)
+    return _get_base_class(type_) in (list, tuple)
+
+
+# The container types allowed for table rows and the cells within them.
+_ROW_SUBCLASSES = (List, Tuple)
+
+
+@lru_cache(maxsize=512)
+def _cached_is_valid_rows_type(outer_type) -> bool:
+    """Check that a rows var type is a list or tuple of lists or tuples.
+
+    The verdict only depends on the type, so it is cached to avoid re-walking
+    the same annotation every time a table body is rebuilt.
+
+    Args:
+        outer_type: The type of the rows var.
+
+    Returns:
+        Whether the outer and inner container types are lists or tuples.
+    """
+    inner_type = outer_type.__args__[0] if hasattr(outer_type, "__args__") else None
+    return types._issubclass(_get_base_class(outer_type), _ROW_SUBCLASSES) and (
+        inner_type is None
+        or types._issubclass(_get_base_class(inner_type), _ROW_SUBCLASSES)
+    )
+
+
+def _is_valid_rows_type(outer_type) -> bool:
+    """Check that a rows var type is a list or tuple of lists or tuples.
+
+    Args:
+        outer_type: The type of the rows var.
+
+    Returns:
+        Whether the outer and inner container types are lists or tuples.
+    """
+    return _call_cached(_cached_is_valid_rows_type, outer_type)
+
+
 class Table(ChakraComponent):
     """A table component."""
 
@@ -97,15 +197,9 @@ class Thead(ChakraComponent):
             TypeError: If headers are not of type list or type tuple.
 
         """
-        allowed_types = (list, tuple)
-        if (
-            (
-                isinstance(headers, Var)
-                and not types.check_type_in_allowed_types(headers.type_, allowed_types)
-            )
-            or not isinstance(headers, Var)
-            and not types.check_type_in_allowed_types(type(headers), allowed_types)
-        ):
+        if not _VALIDATE:
+            return
+        if not _is_list_or_tuple(headers):
             raise TypeError("table headers should be a list or tuple")
 
 
@@ -154,29 +248,16 @@ class Tbody(ChakraComponent):
         Raises:
             TypeError: If rows are not lists or tuples containing inner lists or tuples.
         """
-        allowed_subclasses = (List, Tuple)
+        if not _VALIDATE:
+            return
         if isinstance(rows, Var):
-            outer_type = rows.type_
-            inner_type = (
-                outer_type.__args__[0] if hasattr(outer_type, "__args__") else None
-            )
-
-            # check that the outer container and inner container types are lists or tuples.
-            if not (
-                types._issubclass(types.get_base_class(outer_type), allowed_subclasses)
-                and (
-                    inner_type is None
-                    or types._issubclass(
-                        types.get_base_class(inner_type), allowed_subclasses
-                    )
-                )
-            ):
+            if not _is_valid_rows_type(rows.type_):
                 raise TypeError(
-                    f"table rows should be a list or tuple containing inner lists or tuples. Got {outer_type} instead"
+                    f"table rows should be a list or tuple containing inner lists or tuples. Got {rows.type_} instead"
                 )
         elif not (
-            types._issubclass(type(rows), allowed_subclasses)
-            and (not rows or types._issubclass(type(rows[0]), allowed_subclasses))
+            isinstance(rows, (list, tuple))
+            and (not rows or isinstance(rows[0], (list, tuple)))
         ):
             raise TypeError(
                 "table rows should be a list or tuple containing inner lists or tuples."
@@ -218,16 +299,10 @@ class Tfoot(ChakraComponent):
         Raises:
             TypeError: If footers are not of type list.
         """
-        allowed_types = (list, tuple)
-        if (
-            (
-                isinstance(footers, Var)
-                and not types.check_type_in_allowed_types(footers.type_, allowed_types)
-            )
-            or not isinstance(footers, Var)
-            and not types.check_type_in_allowed_types(type(footers), allowed_types)
-        ):
-            raise TypeError("table headers should be a list or tuple")
+        if not _VALIDATE:
+            return
+        if not _is_list_or_tuple(footers):
+            raise TypeError("table footers should be a list or tuple")
 
 
 class Tr(ChakraComponent):
@@ -251,13 +326,12 @@ class Tr(ChakraComponent):
         Returns:
             The table row component
         """
-        types = {"header": Th, "data": Td}
-        cell_cls = types.get(cell_type)
+        cell_cls = _CELL_CLS.get(cell_type)
         if len(children) == 0 and cell_cls:
             if isinstance(cells, Var):
                 children = [Foreach.create(cells, cell_cls.create)]
             else:
-                children = [cell_cls.create(cell) for cell in cells or []]
+                children = list(map(cell_cls.create, cells)) if cells else []
         return super().create(*children, **props)
 
 
@@ -285,6 +359,10 @@ class Td(ChakraComponent):
     is_numeric: Var[bool]
 
 
+# Map the cell type of a table row to its cell component.
+_CELL_CLS: Dict[str, Type[ChakraComponent]] = {"header": Th, "data": Td}
+
+
 class TableCaption(ChakraComponent):
     """A table caption component."""
 
@@ -7,6 +7,7 @@ from .base import (
     POLLING_MAX_HTTP_BUFFER_SIZE,
     PYTEST_CURRENT_TEST,
     SKIP_COMPILE_ENV_VAR,
+    SKIP_TYPECHECK_ENV_VAR,
     ColorMode,
     Dirs,
     Env,
@@ -84,6 +85,7 @@ __ALL__ = [
     ROUTE_NOT_FOUND,
     SETTER_PREFIX,
     SKIP_COMPILE_ENV_VAR,
+    SKIP_TYPECHECK_ENV_VAR,
     SocketEvent,
     STYLES_DIR,
     Tailwind,
@@ -169,6 +169,9 @@ LOCAL_STORAGE = "local_storage"
 # If this env var is set to "yes", App.compile will be a no-op
 SKIP_COMPILE_ENV_VAR = "__REFLEX_SKIP_COMPILE"
 
+# If this env var is set to "1", table headers, rows and footers are not type checked.
+SKIP_TYPECHECK_ENV_VAR = "REFLEX_SKIP_TYPECHECK"
+
 # Testing variables.
 # Testing os env set by pytest when running a test case.
 PYTEST_CURRENT_TEST = "PYTEST_CURRENT_TEST"
@@ -3,8 +3,11 @@ from typing import List, Tuple
 
 import pytest
 
+from reflex import constants
+from reflex.components.datadisplay import table
 from reflex.components.datadisplay.table import Tbody, Tfoot, Thead
 from reflex.state import State
+from reflex.vars import BaseVar
 
 PYTHON_GT_V38 = sys.version_info.major >= 3 and sys.version_info.minor > 8
 
@@ -173,5 +176,29 @@ def test_create_table_footer_with_valid_footers_prop(footers):
     ],
 )
 def test_create_table_footer_with_invalid_footers_prop(footers):
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="table footers"):
         Tfoot.create(footers=footers)
+
+
+@pytest.mark.skipif(not PYTHON_GT_V38, reason="Annotated requires python 3.9+")
+def test_validate_unhashable_annotation():
+    from typing import Annotated
+
+    var = BaseVar(name="rows", type_=Annotated[List[List[int]], []])
+    Thead.validate_headers(var)
+    Tbody.validate_rows(var)
+    Tfoot.validate_footers(var)
+
+
+def test_skip_table_validation(monkeypatch):
+    monkeypatch.setattr(table, "_VALIDATE", False)
+    Thead.create(headers="random, header")
+    Tbody.create(rows=TableState.rows_List_str)
+    Tfoot.create(footers="random, footers")
+
+
+def test_skip_table_validation_env_var(monkeypatch):
+    monkeypatch.delenv(constants.SKIP_TYPECHECK_ENV_VAR, raising=False)
+    assert table._should_validate()
+    monkeypatch.setenv(constants.SKIP_TYPECHECK_ENV_VAR, "1")
+    assert not table._should_validate()